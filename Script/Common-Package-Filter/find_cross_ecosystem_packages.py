@@ -8,10 +8,25 @@ and a summary file is generated.
 """
 
 import pandas as pd
-import re
+import pyarrow as pa
+from pyarrow import csv as arrow_csv
+import csv
+import os
+import shutil
 from pathlib import Path
 from tqdm import tqdm
 from itertools import combinations
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Optional Cython implementation of the URL normalization (normalize_urls.pyx),
+# compiled on first import; the pandas version is used when it cannot be built
+try:
+    import pyximport
+    pyximport.install(language_level=3)
+    from normalize_urls import normalize_batch
+except ImportError:
+    normalize_batch = None
 
 
 # ============================================================================
@@ -26,77 +41,212 @@ INPUT_BASE_PATH = Path(__file__).parent.parent.parent / "Resource" / "Dataset" /
 OUTPUT_RESULTS_PATH = Path(__file__).parent.parent.parent / "Resource" / "Dataset" / "Common-Package-Filter"
 
 # ============================================================================
+# PARTITION CONFIGURATION
+# ============================================================================
+# Number of hash partitions of the normalized repo URLs. With 1, all ecosystems
+# are indexed and matched in memory at once. For inputs that do not fit in RAM,
+# increase it: every ecosystem is then split by repo hash into Parquet files
+# (in a "partitions" folder under the output path, removed at the end), and
+# one partition of all ecosystems is matched at a time.
+NUM_PARTITIONS = 1
 
+# ============================================================================
 
-def normalize_github_url(url):
+
+def normalize_github_urls(urls):
     """
-    Normalize GitHub repository URLs to a standard format for comparison.
-    Returns None if URL is invalid, empty, or not a GitHub URL.
+    Normalize a column of GitHub repository URLs to a standard format
+    ("github.com/owner/repo") for comparison. Every step is a pandas string
+    method, which runs over the entire Series at once instead of calling back
+    into Python for every row.
+    Returns a Series with None where a URL is invalid, empty, or not a GitHub URL.
     """
-    if pd.isna(url) or not url or url.strip() == "":
-        return None
-
-    url = str(url).strip().lower()
+    index = urls.index
+    urls = urls.where(urls.notna(), "").astype(str).str.strip()
+
+    # Arrow lowercases one character at a time, while str.lower() also applies
+    # Unicode special casing ("İ" -> "i̇", a final "Σ" -> "ς"). The rare non-ASCII
+    # URLs use str.lower(), so the result matches the Cython version exactly
+    non_ascii = ~urls.str.isascii()
+    lowered = urls.str.lower()
+    if non_ascii.any():
+        lowered[non_ascii] = [url.lower() for url in urls[non_ascii]]
+    urls = lowered
 
     # Check if it's a GitHub URL
-    if "github.com" not in url:
-        return None
+    urls = urls[urls.str.contains("github.com", regex=False)]
 
     # Remove common suffixes and prefixes
-    url = re.sub(r"\.git$", "", url)
-    url = re.sub(r"/$", "", url)
-    
+    urls = urls.str.replace(r"\.git$", "", regex=True)
+    urls = urls.str.replace(r"/$", "", regex=True)
+
     # Remove git protocol prefixes
-    url = url.replace('git+https://', 'https://')
-    url = url.replace('git+ssh://', 'ssh://')
-    url = url.replace('git://', 'https://')
-
-    # Extract path from URL
-    try:
-        # Handle various GitHub URL formats (https, ssh, git@)
-        match = re.search(r"github\.com[:/]([^/]+/[^/\s]+)", url)
-        if match:
-            repo_path = match.group(1)
-            # Remove trailing content after repository name
-            repo_path = re.split(r"[\s#?]", repo_path)[0]
-            # Remove .git suffix if still present in the extracted path
-            repo_path = re.sub(r"\.git$", "", repo_path)
-            # Remove trailing slash
-            repo_path = repo_path.rstrip('/')
-            return f"github.com/{repo_path}"
-    except:
-        pass
-
-    return None
-
-
-def normalize_github_url_with_fallback(repo_url, homepage_url):
+    urls = urls.str.replace("git+https://", "https://", regex=False)
+    urls = urls.str.replace("git+ssh://", "ssh://", regex=False)
+    urls = urls.str.replace("git://", "https://", regex=False)
+
+    # Extract "owner/repo" from URL (https, ssh, git@), then remove trailing
+    # content after the repository name, a leftover .git suffix and trailing slashes
+    repo_paths = urls.str.extract(r"github\.com[:/]([^/]+/[^/\s]+)", expand=False).dropna()
+    repo_paths = repo_paths.str.extract(r"^([^\s#?]*)", expand=False)
+    repo_paths = repo_paths.str.replace(r"\.git$", "", regex=True).str.rstrip("/")
+
+    normalized = ("github.com/" + repo_paths).astype(object).reindex(index)
+    return normalized.where(normalized.notna(), None)
+
+
+def normalize_url_column(urls):
     """
-    Normalize GitHub URL with Homepage URL as fallback.
-    First tries Repository URL, if that fails, tries Homepage URL.
-    Returns None if neither contains a valid GitHub URL.
+    Normalize a column of URLs with the Cython extension when it is available,
+    otherwise with normalize_github_urls.
+    Returns a Series with None where a URL is invalid, empty, or not a GitHub URL.
     """
-    # Try Repository URL first
-    normalized = normalize_github_url(repo_url)
-    if normalized:
-        return normalized
-    
-    # Fallback to Homepage URL
-    normalized = normalize_github_url(homepage_url)
-    return normalized
+    if normalize_batch is not None:
+        return pd.Series(normalize_batch(urls.tolist()), index=urls.index, dtype=object)
+    return normalize_github_urls(urls)
+
+
+# Input columns used for matching and output; all other columns are not parsed
+PACKAGE_COLUMNS = ["ID", "Name", "Homepage URL", "Repository URL"]
+
+# Bytes of CSV parsed per chunk (roughly 500,000 packages). Only one chunk of
+# raw package data is held in memory at a time while loading
+READ_BLOCK_SIZE = 64 << 20
+
+# Values read as missing, the same as the pd.read_csv defaults
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def read_package_chunks(filepath):
+    """
+    Read a package CSV file (plain or .gz) in chunks of about READ_BLOCK_SIZE bytes
+    with pyarrow's streaming CSV reader, since the pyarrow engine of pd.read_csv
+    does not support chunksize.
+    Yields DataFrames with the PACKAGE_COLUMNS as Arrow-backed strings, which keep
+    each column in one contiguous buffer instead of one Python object per value.
+    """
+    reader = arrow_csv.open_csv(
+        filepath,
+        read_options=arrow_csv.ReadOptions(block_size=READ_BLOCK_SIZE),
+        parse_options=arrow_csv.ParseOptions(newlines_in_values=True),
+        convert_options=arrow_csv.ConvertOptions(
+            include_columns=PACKAGE_COLUMNS,
+            column_types={column: pa.string() for column in PACKAGE_COLUMNS},
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    types_mapper = {pa.string(): pd.StringDtype("pyarrow")}.get
+    for batch in reader:
+        yield batch.to_pandas(types_mapper=types_mapper)
+
+
+def partition_to_disk(df, num_partitions, outdir, chunk_number):
+    """
+    Split the packages with a valid normalized repo of one chunk by a hash of the
+    repo, and write them to outdir / part_<n> / chunk_<chunk_number>.parquet for
+    each of the num_partitions partitions.
+    The hash does not depend on the process, so a repo lands in the same
+    partition number in every ecosystem.
+    """
+    indexed = df[df["normalized_repo"].notna()]
+    hashes = pd.util.hash_pandas_object(indexed["normalized_repo"], index=False).to_numpy()
+    part_numbers = hashes % num_partitions
+
+    for part in range(num_partitions):
+        part_dir = outdir / f"part_{part}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        indexed[part_numbers == part].to_parquet(
+            part_dir / f"chunk_{chunk_number:05d}.parquet", index=False
+        )
+
+
+def load_partition_lookups(partition_path, ecosystems, part):
+    """
+    Build the lookup indices of one partition from the Parquet files of every
+    ecosystem, adding the chunks in the order they were read.
+    """
+    lookups = {}
+    for ecosystem in ecosystems:
+        lookup = new_lookup_index()
+        for chunk_path in sorted((partition_path / ecosystem / f"part_{part}").glob("*.parquet")):
+            add_to_lookup_index(lookup, pd.read_parquet(chunk_path))
+        lookups[ecosystem] = lookup
+    return lookups
+
+
+def load_ecosystem(ecosystem, filepaths, partition_path=None, num_partitions=1):
+    """
+    Load the package files of one ecosystem, normalize their URLs and build the
+    lookup index in a single pass: each chunk read is normalized and added to the
+    index, then freed, so the whole file is never held as a DataFrame. Runs in a
+    worker process, so only the lookup index is sent back.
+    With a partition_path, each chunk is split into num_partitions Parquet files
+    in partition_path / ecosystem instead, and no lookup index is built.
+    Returns a tuple (ecosystem, package_count, lookup, missing_files); lookup is
+    None when none of the files exist or the packages were partitioned.
+    """
+    lookup = new_lookup_index()
+    package_count = 0
+    chunk_number = 0
+    missing_files = []
+
+    # Load multiple files one after another if necessary (e.g., Go parts)
+    for filepath in filepaths:
+        if not filepath.exists():
+            missing_files.append(filepath)
+            continue
+
+        for chunk in read_package_chunks(filepath):
+            package_count += len(chunk)
+
+            # Add normalized column, normalizing each URL column of the chunk as a whole
+            # Use Homepage URL as fallback when Repository URL is not a valid GitHub URL
+            normalized_repo = normalize_url_column(chunk["Repository URL"])
+            normalized_homepage = normalize_url_column(chunk["Homepage URL"])
+            chunk["normalized_repo"] = normalized_repo.where(
+                normalized_repo.notna(), normalized_homepage
+            )
 
+            if partition_path is not None:
+                partition_to_disk(chunk, num_partitions, partition_path / ecosystem, chunk_number)
+                chunk_number += 1
+            else:
+                add_to_lookup_index(lookup, chunk)
+
+    if len(missing_files) == len(filepaths) or partition_path is not None:
+        return ecosystem, package_count, None, missing_files
+
+    return ecosystem, package_count, lookup, missing_files
+
+
+def compressed_or_plain(path):
+    """
+    Return path (a .csv.gz file) if it exists, otherwise the plain .csv file of
+    the same name, so inputs written before the miners compressed them still load.
+    """
+    return path if path.exists() else path.with_suffix("")
 
-def load_package_data(base_path):
-    """Load all package CSV files and create normalized lookup structures."""
 
-    packages = {}
+def load_package_data(base_path, partition_path=None, num_partitions=1):
+    """
+    Load all package CSV files and build their lookup indices, or split them into
+    num_partitions Parquet files per ecosystem when a partition_path is given.
+    Ecosystems are independent, so each one is processed in its own worker process.
+    Returns a tuple (package_counts, lookups) of dictionaries keyed by ecosystem;
+    lookups is empty when the packages were partitioned.
+    """
 
     # Define file paths
     files = {
-        "Maven": [base_path / "Maven.csv"],
+        "Maven": [compressed_or_plain(base_path / "Maven.csv.gz")],
         "NPM": [base_path / "NPM.csv"],
         "PyPI": [base_path / "PyPI.csv"],
-        "Crates": [base_path / "Crates.csv"],
+        "Crates": [compressed_or_plain(base_path / "Crates.csv.gz")],
         "Go": [base_path / f"Go.csv"],
         "PHP": [base_path / "PHP.csv"],
         "Ruby": [base_path / "Ruby.csv"],
@@ -104,163 +254,161 @@ def load_package_data(base_path):
 
     print("Loading package data...")
 
-    for ecosystem, filepaths in files.items():
-        print(f"  Loading {ecosystem}...")
+    results = {}
+    max_workers = min(len(files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(load_ecosystem, ecosystem, filepaths, partition_path, num_partitions)
+            for ecosystem, filepaths in files.items()
+        ]
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc="  Loading", unit="ecosystem", leave=False
+        ):
+            ecosystem, package_count, lookup, missing_files = future.result()
+            results[ecosystem] = (package_count, lookup, missing_files)
 
-        # Load and combine multiple files if necessary (e.g., Go parts)
-        dfs = []
-        for filepath in filepaths:
-            if filepath.exists():
-                df_part = pd.read_csv(filepath, low_memory=False)
-                dfs.append(df_part)
-            else:
-                print(f"    Warning: {filepath} not found, skipping...")
+    # Report in a fixed order, whichever worker finished first
+    package_counts = {}
+    lookups = {}
+    for ecosystem in files:
+        package_count, lookup, missing_files = results[ecosystem]
+        print(f"  {ecosystem}:")
+        for filepath in missing_files:
+            print(f"    Warning: {filepath} not found, skipping...")
 
-        if not dfs:
+        if len(missing_files) == len(files[ecosystem]):
             print(f"    Error: No files found for {ecosystem}, skipping...")
             continue
 
-        # Combine all parts into one DataFrame
-        df = pd.concat(dfs, ignore_index=True)
-
-        # Add normalized columns with progress bar
-        # Use Homepage URL as fallback when Repository URL is missing
-        tqdm.pandas(desc=f"    Normalizing {ecosystem} repos", leave=False)
-        df["normalized_repo"] = df.progress_apply(
-            lambda row: normalize_github_url_with_fallback(
-                row["Repository URL"], row["Homepage URL"]
-            ),
-            axis=1
-        )
+        package_counts[ecosystem] = package_count
+        print(f"    Loaded {package_count} packages")
+        if lookup is None:
+            print(f"    Split into {num_partitions} partitions")
+        else:
+            lookups[ecosystem] = lookup
+            print(f"    Indexed {len(lookup[0])} packages with valid repo")
 
-        packages[ecosystem] = df
-        print(f"    Loaded {len(df)} packages")
+    return package_counts, lookups
 
-    return packages
 
-
-def build_lookup_index(df, ecosystem_name):
+def new_lookup_index():
     """
-    Build efficient lookup indices for a package DataFrame.
-    Returns a dictionary mapping normalized repo URLs to package data.
+    Create an empty lookup index, a tuple (index_map, ids, names, homepages,
+    repo_urls): index_map maps normalized repo URLs to a row position in the four
+    parallel package data lists.
     """
-    lookup = {}
+    return {}, [], [], [], []
+
 
-    for _, row in tqdm(
-        df.iterrows(), total=len(df), desc=f"    Indexing {ecosystem_name}", leave=False
-    ):
-        repo = row["normalized_repo"]
+def add_to_lookup_index(lookup, df):
+    """Append the packages of a DataFrame that have a valid normalized repo to a lookup index."""
+    index_map, ids, names, homepages, repo_urls = lookup
 
-        # Only index packages with valid repo
-        if repo:
-            # Store package data with repo as key
-            lookup[repo] = {
-                "ID": row["ID"],
-                "Name": row["Name"],
-                "Homepage": row["Homepage URL"],
-                "Repo": row["Repository URL"],
-            }
+    # Only index packages with valid repo
+    indexed = df[df["normalized_repo"].notna()]
+    start = len(ids)
 
-    return lookup
+    # Package data is kept column-wise, so each package costs one dict entry
+    # pointing at its row instead of a container of its own. Missing values
+    # become None, which csv.writer writes as an empty field
+    ids.extend(indexed["ID"].to_numpy(dtype=object, na_value=None))
+    names.extend(indexed["Name"].to_numpy(dtype=object, na_value=None))
+    homepages.extend(indexed["Homepage URL"].to_numpy(dtype=object, na_value=None))
+    repo_urls.extend(indexed["Repository URL"].to_numpy(dtype=object, na_value=None))
 
+    # Updated in one C-level call; a repo shared by several packages keeps the last one
+    repos = indexed["normalized_repo"].to_numpy()
+    index_map.update(zip(repos, range(start, start + len(repos))))
 
-def deduplicate_by_repository(df, ecosystems):
+
+def group_repos_by_ecosystems(repo_sets, combinations_list):
     """
-    Remove duplicate entries based on repository URL, keeping only the first occurrence.
-    This ensures each unique repository appears only once in the output.
+    Group normalized repos by the exact set of ecosystems they appear in.
+    The repos in all ecosystems of a combination are found by intersecting the
+    result of the same combination without its last ecosystem with that
+    ecosystem's set, so each intersection starts from an already reduced set.
+    Combinations are then visited from the highest ecosystem count down, and
+    the repos already assigned to a larger combination (which then contains
+    this one) are removed with a set difference. Both operations run in C and
+    iterate over the smaller set.
 
     Args:
-        df: DataFrame containing matched packages
-        ecosystems: List of ecosystem names involved
+        repo_sets: Dictionary of normalized repo sets by ecosystem
+        combinations_list: List of (ecosystems, output_file) tuples
 
     Returns:
-        DataFrame with duplicates removed based on repository URL
+        Dictionary mapping a tuple of ecosystem names to the sorted list of repos
+        found in exactly those ecosystems
     """
-    if df.empty:
-        return df
-
-    # Get the first ecosystem's repository column as the primary repo
-    primary_repo_col = f"{ecosystems[0]}_Repo"
-
-    if primary_repo_col not in df.columns:
-        return df
-
-    # Track number of rows before deduplication
-    original_count = len(df)
-
-    # Remove duplicates based on the primary repository URL
-    # Keep the first occurrence of each unique repository
-    df_deduplicated = df.drop_duplicates(subset=[primary_repo_col], keep="first")
+    by_size = sorted((tuple(ecosystems) for ecosystems, _ in combinations_list), key=len)
+
+    # Every combination's prefix is a smaller combination (or a single
+    # ecosystem), so it is already computed when the combination is reached
+    common_by_ecosystems = {(ecosystem,): repo_set for ecosystem, repo_set in repo_sets.items()}
+    for ecosystems in by_size:
+        common_by_ecosystems[ecosystems] = (
+            common_by_ecosystems[ecosystems[:-1]] & repo_sets[ecosystems[-1]]
+        )
 
-    removed_count = original_count - len(df_deduplicated)
+    assigned = set()
+    repos_by_ecosystems = {}
+    for ecosystems in reversed(by_size):
+        common = common_by_ecosystems[ecosystems].difference(assigned)
+        assigned.update(common)
 
-    if removed_count > 0:
-        print(
-            f"    Removed {removed_count} duplicate repositories (kept first occurrence)"
-        )
+        # Sorted so the row order of the output does not depend on set iteration order
+        repos_by_ecosystems[ecosystems] = sorted(common)
 
-    return df_deduplicated
+    return repos_by_ecosystems
 
 
-def find_matches(packages, lookups, ecosystems):
+def find_matches(lookups, ecosystems, repos, output_path, append=False):
     """
-    Find packages that match across specified ecosystems using hash-based lookups.
+    Write the matched package rows for repos found in all specified ecosystems.
+    Rows are streamed to the CSV file one at a time instead of being collected
+    in a DataFrame first. No file is created when there are no repos.
 
     Args:
-        packages: Dictionary of DataFrames by ecosystem
         lookups: Dictionary of lookup indices by ecosystem
         ecosystems: List of ecosystem names to check
+        repos: Normalized repos present in every one of these ecosystems
+        output_path: CSV file to write
+        append: Append rows to an existing file instead of creating it with a header
 
     Returns:
-        DataFrame of matching packages (deduplicated by repository)
+        Number of rows written, one per normalized repo
     """
-    if len(ecosystems) < 2:
-        return pd.DataFrame()
-
-    # Start with first ecosystem
-    base_ecosystem = ecosystems[0]
-    base_lookup = lookups[base_ecosystem]
-
-    matches = []
-
-    # Iterate through packages in the base ecosystem with progress bar
-    desc = f"  Matching {' + '.join(ecosystems)}"
-    for key, base_data in tqdm(base_lookup.items(), desc=desc, leave=False):
-        repo = key
-
-        # Check if this package exists in all other ecosystems
-        match_found = True
-        match_data = {
-            f"{base_ecosystem}_ID": base_data["ID"],
-            f"{base_ecosystem}_Name": base_data["Name"],
-            f"{base_ecosystem}_Homepage": base_data["Homepage"],
-            f"{base_ecosystem}_Repo": base_data["Repo"],
-        }
+    if len(ecosystems) < 2 or not repos:
+        return 0
 
-        for other_ecosystem in ecosystems[1:]:
-            other_lookup = lookups[other_ecosystem]
+    # Column names and lookup indices are resolved once per combination, so the
+    # loop only indexes lists and each row is a plain list in column order
+    columns = []
+    ecosystem_lookups = []
+    for ecosystem in ecosystems:
+        columns += [f"{ecosystem}_ID", f"{ecosystem}_Name", f"{ecosystem}_Homepage", f"{ecosystem}_Repo"]
+        ecosystem_lookups.append(lookups[ecosystem])
 
-            # Fast hash-based lookup
-            if key in other_lookup:
-                other_data = other_lookup[key]
-                match_data[f"{other_ecosystem}_ID"] = other_data["ID"]
-                match_data[f"{other_ecosystem}_Name"] = other_data["Name"]
-                match_data[f"{other_ecosystem}_Homepage"] = other_data["Homepage"]
-                match_data[f"{other_ecosystem}_Repo"] = other_data["Repo"]
-            else:
-                match_found = False
-                break
+    with open(output_path, "a" if append else "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if not append:
+            writer.writerow(columns)
 
-        if match_found:
-            matches.append(match_data)
+        # Write each ecosystem's package data for every repo with progress bar
+        desc = f"  Matching {' + '.join(ecosystems)}"
+        for key in tqdm(repos, desc=desc, leave=False):
+            row = []
 
-    matches_df = pd.DataFrame(matches)
+            for index_map, ids, names, homepages, repo_urls in ecosystem_lookups:
+                # Fast hash-based lookup
+                i = index_map[key]
+                row += (ids[i], names[i], homepages[i], repo_urls[i])
 
-    # Deduplicate by repository URL
-    if not matches_df.empty:
-        matches_df = deduplicate_by_repository(matches_df, ecosystems)
+            writer.writerow(row)
 
-    return matches_df
+    # Rows are keyed by the normalized repo computed at load time, so each
+    # repository already appears only once and no deduplication pass is needed
+    return len(repos)
 
 
 def generate_combinations(ecosystems):
@@ -280,129 +428,6 @@ def generate_combinations(ecosystems):
     return all_combinations
 
 
-def deduplicate_across_ecosystem_counts(results_path, combinations_by_count):
-    """
-    Remove packages from lower ecosystem count files if they appear in higher ecosystem count files.
-    This ensures each package only appears in the file with the highest ecosystem count.
-
-    Args:
-        results_path: Path to results directory
-        combinations_by_count: Dictionary mapping ecosystem count to list of (ecosystems_list, filename) tuples
-    """
-    print("\n" + "=" * 80)
-    print("Deduplicating across ecosystem counts...")
-    print("=" * 80)
-    print(
-        "Removing packages from lower ecosystem counts if they exist in higher counts"
-    )
-
-    # Build a set of all package identifiers from higher ecosystem counts
-    # Package identifier: normalized_repo
-    packages_in_higher_counts = {}  # maps count -> set of repo strings
-
-    # Process from highest to lowest ecosystem count
-    for count in sorted(combinations_by_count.keys(), reverse=True):
-        packages_in_higher_counts[count] = set()
-        subfolder = results_path / f"{count}_ecosystems"
-
-        if not subfolder.exists():
-            continue
-
-        # Read all files in this ecosystem count
-        for ecosystems_list, output_file in combinations_by_count[count]:
-            file_path = subfolder / output_file
-
-            if not file_path.exists():
-                continue
-
-            df = pd.read_csv(file_path)
-
-            if df.empty:
-                continue
-
-            # Extract package identifiers from this file
-            # Use the first ecosystem's repo for identification
-            first_ecosystem = ecosystems_list[0]
-            repo_col = f"{first_ecosystem}_Repo"
-
-            if repo_col in df.columns:
-                for _, row in df.iterrows():
-                    repo = normalize_github_url(row[repo_col])
-                    if repo:
-                        packages_in_higher_counts[count].add(repo)
-
-    # Now remove packages from lower counts if they exist in higher counts
-    total_removed = 0
-
-    for count in sorted(combinations_by_count.keys()):
-        subfolder = results_path / f"{count}_ecosystems"
-
-        if not subfolder.exists():
-            continue
-
-        # Get all packages from higher counts
-        higher_packages = set()
-        for higher_count in range(count + 1, max(combinations_by_count.keys()) + 1):
-            if higher_count in packages_in_higher_counts:
-                higher_packages.update(packages_in_higher_counts[higher_count])
-
-        if not higher_packages:
-            continue
-
-        print(f"\nProcessing {count}-ecosystem files:")
-        print(
-            f"  Checking against {len(higher_packages)} packages from higher ecosystem counts"
-        )
-
-        # Process each file in this ecosystem count
-        for ecosystems_list, output_file in combinations_by_count[count]:
-            file_path = subfolder / output_file
-
-            if not file_path.exists():
-                continue
-
-            df = pd.read_csv(file_path)
-            original_count = len(df)
-
-            if df.empty:
-                continue
-
-            # Filter out packages that exist in higher counts
-            first_ecosystem = ecosystems_list[0]
-            repo_col = f"{first_ecosystem}_Repo"
-
-            if repo_col not in df.columns:
-                continue
-
-            # Create a mask for rows to keep
-            def should_keep_row(row):
-                repo = normalize_github_url(row[repo_col])
-                if repo:
-                    return repo not in higher_packages
-                return True
-
-            df_filtered = df[df.apply(should_keep_row, axis=1)]
-
-            removed = original_count - len(df_filtered)
-
-            if removed > 0:
-                print(
-                    f"  {output_file}: Removed {removed} packages (found in higher counts)"
-                )
-                total_removed += removed
-
-                if df_filtered.empty:
-                    print(f"  {output_file} is now empty. Deleting file.")
-                    file_path.unlink()
-                else:
-                    # Save the filtered DataFrame
-                    df_filtered.to_csv(file_path, index=False)
-
-    print(f"\n{'='*80}")
-    print(f"Total packages removed from lower ecosystem counts: {total_removed}")
-    print(f"{'='*80}")
-
-
 def main():
     """Main execution function."""
 
@@ -415,44 +440,27 @@ def main():
     print("Cross-Ecosystem Package Analysis")
     print("=" * 80)
 
-    # Load all package data
-    packages = load_package_data(base_path)
+    # Load all package data and build lookup indices for efficient matching.
+    # With several partitions, the packages are split on disk instead and the
+    # indices are built one partition at a time below
+    partition_path = results_path / "partitions" if NUM_PARTITIONS > 1 else None
+    if partition_path is not None:
+        # Remove partition files left behind by a run that did not finish, which
+        # would otherwise be read back together with the new ones
+        shutil.rmtree(partition_path, ignore_errors=True)
+    package_counts, lookups = load_package_data(base_path, partition_path, NUM_PARTITIONS)
 
     # Calculate input statistics
-    total_input_packages = 0
-    all_valid_repos = set()
-    for df in packages.values():
-        total_input_packages += len(df)
-        # valid repos only
-        repos = df["normalized_repo"].dropna()
-        all_valid_repos.update(repos)
-    
-    valid_packages_count = len(all_valid_repos)
+    total_input_packages = sum(package_counts.values())
 
     # Get list of available ecosystems
-    ecosystems = sorted(packages.keys())
+    ecosystems = sorted(package_counts.keys())
     print(f"\nAvailable ecosystems: {', '.join(ecosystems)}")
 
-    # Build lookup indices for efficient matching
-    print("\n" + "=" * 80)
-    print("Building lookup indices...")
-    print("=" * 80)
-    lookups = {}
-    for ecosystem, df in packages.items():
-        print(f"  Building index for {ecosystem}...")
-        lookups[ecosystem] = build_lookup_index(df, ecosystem)
-        print(f"    Indexed {len(lookups[ecosystem])} packages with valid repo")
-
     # Generate all combinations dynamically
     all_combinations = generate_combinations(ecosystems)
     print(f"\n  Total combinations to process: {len(all_combinations)}")
 
-    print("\n" + "=" * 80)
-    print("Finding cross-ecosystem packages...")
-    print("=" * 80)
-
-    results_summary = []
-
     # Group combinations by ecosystem count
     combinations_by_count = {}
     for combo_list, filename in all_combinations:
@@ -461,34 +469,84 @@ def main():
             combinations_by_count[count] = []
         combinations_by_count[count].append((combo_list, filename))
 
-    # Process each group and save to corresponding folder
+    # Create subfolder for each ecosystem count
+    for count in combinations_by_count:
+        (results_path / f"{count}_ecosystems").mkdir(exist_ok=True)
+
+    print("\n" + "=" * 80)
+    print("Finding cross-ecosystem packages...")
+    print("=" * 80)
+
+    # Statistics collected over all partitions. Partitions never share a repo,
+    # so their counts add up
+    valid_packages_count = 0
+    indexed_counts = {ecosystem: 0 for ecosystem in ecosystems}
+    package_counts_by_file = defaultdict(int)
+
+    # Cross-ecosystem repos per ecosystem. Each repo is written to exactly one
+    # combination, so adding up the row counts of the combinations that include
+    # an ecosystem counts every repo once
+    cross_ecosystem_counts = {ecosystem: 0 for ecosystem in ecosystems}
+
+    for part in range(NUM_PARTITIONS):
+        if partition_path is not None:
+            print(f"\nPartition {part + 1}/{NUM_PARTITIONS}:")
+            lookups = load_partition_lookups(partition_path, ecosystems, part)
+
+        # Repo sets are built once per ecosystem and reused by every combination
+        repo_sets = {ecosystem: frozenset(lookups[ecosystem][0]) for ecosystem in ecosystems}
+
+        for ecosystem in ecosystems:
+            indexed_counts[ecosystem] += len(repo_sets[ecosystem])
+        # valid repos only
+        valid_packages_count += len(frozenset().union(*repo_sets.values()))
+
+        # Each repo is only reported for the exact set of ecosystems it appears in,
+        # i.e. the combination with the highest ecosystem count that contains it
+        repos_by_ecosystems = group_repos_by_ecosystems(repo_sets, all_combinations)
+
+        for ecosystems_list, output_file in tqdm(
+            all_combinations, desc="  Matching combinations", unit="combination", leave=False
+        ):
+            # Find matches (repo must match) and save them. A CSV is only saved
+            # if matches were found: the first partition with matches creates
+            # the file, later ones append to it
+            repos = repos_by_ecosystems[tuple(ecosystems_list)]
+            output_path = results_path / f"{len(ecosystems_list)}_ecosystems" / output_file
+            package_count = find_matches(
+                lookups,
+                ecosystems_list,
+                repos,
+                output_path,
+                append=package_counts_by_file[output_path] > 0,
+            )
+
+            package_counts_by_file[output_path] += package_count
+            for ecosystem in ecosystems_list:
+                cross_ecosystem_counts[ecosystem] += package_count
+
+    if partition_path is not None:
+        shutil.rmtree(partition_path)
+
+    results_summary = []
+
+    # Report each group and its saved files
     for count in sorted(combinations_by_count.keys()):
         print(f"\n{'='*80}")
-        print(f"Processing {count}-ecosystem combinations")
+        print(f"{count}-ecosystem combinations")
         print(f"{'='*80}")
 
-        # Create subfolder for this ecosystem count
         subfolder = results_path / f"{count}_ecosystems"
-        subfolder.mkdir(exist_ok=True)
 
-        for ecosystems_list, output_file in tqdm(
-            combinations_by_count[count],
-            desc=f"{count}-ecosystem combinations",
-            unit="combination",
-        ):
+        for ecosystems_list, output_file in combinations_by_count[count]:
             print(f"\n{' + '.join(ecosystems_list)}:")
             print("-" * 40)
 
-            # Find matches (both name AND repo must match)
-            matches_df = find_matches(packages, lookups, ecosystems_list)
-
-            package_count = len(matches_df)
+            output_path = subfolder / output_file
+            package_count = package_counts_by_file[output_path]
             print(f"  Found {package_count} packages")
 
-            # Only save CSV if matches were found
             if package_count > 0:
-                output_path = subfolder / output_file
-                matches_df.to_csv(output_path, index=False)
                 print(f"  Saved to: {output_path}")
 
                 results_summary.append(
@@ -502,35 +560,6 @@ def main():
             else:
                 print(f"  Skipped saving (no matches found)")
 
-    # Deduplicate across ecosystem counts (remove from lower counts if in higher counts)
-    deduplicate_across_ecosystem_counts(results_path, combinations_by_count)
-
-    # Regenerate summary after deduplication
-    print("\n" + "=" * 80)
-    print("Regenerating summary after deduplication...")
-    print("=" * 80)
-
-    results_summary = []
-    for count in sorted(combinations_by_count.keys()):
-        subfolder = results_path / f"{count}_ecosystems"
-        if not subfolder.exists():
-            continue
-
-        for ecosystems_list, output_file in combinations_by_count[count]:
-            file_path = subfolder / output_file
-            if file_path.exists():
-                df = pd.read_csv(file_path)
-                package_count = len(df)
-                if package_count > 0:
-                    results_summary.append(
-                        {
-                            "Ecosystem Count": count,
-                            "Ecosystems": " + ".join(ecosystems_list),
-                            "Package Count": package_count,
-                            "Output File": f"{count}_ecosystems/{output_file}",
-                        }
-                    )
-
     # Create summary DataFrame
     summary_df = pd.DataFrame(results_summary)
 
@@ -547,45 +576,13 @@ def main():
     
     for ecosystem in ecosystems:
         # Get total packages loaded for this ecosystem
-        total_packages_loaded = len(packages[ecosystem])
+        total_packages_loaded = package_counts[ecosystem]
         
         # Get all packages from this ecosystem that have valid repos
-        ecosystem_lookup = lookups[ecosystem]
-        total_packages_with_repo = len(ecosystem_lookup)
-        
-        # Find all cross-ecosystem packages from this ecosystem
-        cross_ecosystem_repos = set()
-        
-        for count in sorted(combinations_by_count.keys()):
-            subfolder = results_path / f"{count}_ecosystems"
-            if not subfolder.exists():
-                continue
-            
-            for ecosystems_list, output_file in combinations_by_count[count]:
-                # Only process combinations that include this ecosystem
-                if ecosystem not in ecosystems_list:
-                    continue
-                
-                file_path = subfolder / output_file
-                if not file_path.exists():
-                    continue
-                
-                df = pd.read_csv(file_path)
-                if df.empty:
-                    continue
-                
-                # Get the repo column for this ecosystem
-                repo_col = f"{ecosystem}_Repo"
-                if repo_col not in df.columns:
-                    continue
-                
-                # Add all repos from this ecosystem to the set
-                for _, row in df.iterrows():
-                    repo = normalize_github_url(row[repo_col])
-                    if repo:
-                        cross_ecosystem_repos.add(repo)
+        total_packages_with_repo = indexed_counts[ecosystem]
         
-        cross_ecosystem_count = len(cross_ecosystem_repos)
+        # Cross-ecosystem packages from this ecosystem, counted while matching
+        cross_ecosystem_count = cross_ecosystem_counts[ecosystem]
         percentage = (cross_ecosystem_count / total_packages_with_repo * 100) if total_packages_with_repo > 0 else 0
         
         ecosystem_stats[ecosystem] = {
@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython implementation of the GitHub URL normalization used by
+find_cross_ecosystem_packages.py.
+
+normalize_batch() applies the same steps as normalize_github_urls() to each URL,
+but replaces the regular expressions with direct scans over the characters of
+each string, so no match objects or intermediate strings are created for the
+path extraction.
+
+The module is compiled on first import through pyximport (requires Cython and a
+C compiler). find_cross_ecosystem_packages.py falls back to the pandas version
+when it cannot be built.
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cdef unicode GITHUB = u"github.com"
+
+
+cdef inline bint _ends_with(unicode s, Py_ssize_t n, unicode suffix):
+    """Check whether the first n characters of s end with suffix."""
+    cdef Py_ssize_t m = len(suffix)
+    return n >= m and s[n - m:n] == suffix
+
+
+cdef object _normalize(object url):
+    """Normalize one URL; same steps as normalize_github_urls()."""
+    cdef unicode s
+    cdef Py_ssize_t n, p, q, a, k, b, e, i
+    cdef Py_UCS4 c
+
+    # Missing values (None/NaN) and anything else that is not a string
+    if not isinstance(url, str):
+        return None
+
+    s = url.strip().lower()
+
+    # Check if it's a GitHub URL (this also rejects empty strings)
+    if GITHUB not in s:
+        return None
+
+    # Remove a trailing ".git", then a trailing "/". After strip() the string
+    # cannot end with a newline, but removing ".git" can expose one, and "/$"
+    # also matches a slash right before a final newline
+    n = len(s)
+    if _ends_with(s, n, u".git"):
+        s = s[:n - 4]
+        n -= 4
+    if n >= 1 and s[n - 1] == u"/":
+        s = s[:n - 1]
+    elif n >= 2 and s[n - 1] == u"\n" and s[n - 2] == u"/":
+        s = s[:n - 2] + u"\n"
+
+    # Remove git protocol prefixes
+    s = s.replace(u"git+https://", u"https://")
+    s = s.replace(u"git+ssh://", u"ssh://")
+    s = s.replace(u"git://", u"https://")
+
+    # Extract "owner/repo" after the first "github.com:" or "github.com/" that
+    # is followed by a non-empty owner, a slash and a non-empty repository name
+    n = len(s)
+    p = s.find(GITHUB)
+    while p != -1:
+        q = p + 10
+        if q < n and (s[q] == u":" or s[q] == u"/"):
+            a = q + 1
+            k = s.find(u"/", a)
+            if k > a:
+                b = k + 1
+                e = b
+                while e < n:
+                    c = s[e]
+                    if c == u"/" or Py_UNICODE_ISSPACE(c):
+                        break
+                    e += 1
+                if e > b:
+                    break
+        p = s.find(GITHUB, p + 1)
+    else:
+        return None
+
+    # Remove trailing content after repository name
+    i = a
+    while i < e:
+        c = s[i]
+        if c == u"#" or c == u"?" or Py_UNICODE_ISSPACE(c):
+            break
+        i += 1
+
+    # Remove .git suffix if still present, then trailing slashes
+    if _ends_with(s, i, u".git"):
+        i -= 4
+    while i > a and s[i - 1] == u"/":
+        i -= 1
+
+    return u"github.com/" + s[a:i]
+
+
+cpdef list normalize_batch(list urls):
+    """
+    Normalize a list of URLs.
+    Returns a list of the same length with None where a URL is invalid, empty,
+    or not a GitHub URL.
+    """
+    return [_normalize(url) for url in urls]
@@ -1,9 +1,12 @@
 import requests
 import csv
-import time
+import gzip
+import io
+import itertools
 import os
+import shutil
+import sys
 import tarfile
-import pandas as pd
 from tqdm import tqdm
 
 
@@ -12,77 +15,106 @@ from tqdm import tqdm
 # ============================================================================
 # Modify these paths when moving the script to another location
 
-# Temporary download and extraction paths
+# Download path: the dump is kept between runs together with its ETag, so an
+# unchanged dump is not downloaded again
 DUMP_PATH = "db-dump.tar.gz"
-EXTRACT_PATH = "crates-db"
+ETAG_PATH = DUMP_PATH + ".etag"
 
-# Output path: Location where the CSV file will be saved
+# Output path: Location where the gzip-compressed CSV file will be saved
 OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'Resource', 'Dataset', 'Package-List'))
-OUTPUT_FILENAME = "Crates.csv"
+OUTPUT_FILENAME = "Crates.csv.gz"
 
 # ============================================================================
 
-def download_file(url, filename):
-    """Downloads a file from a URL with a progress bar."""
-    response = requests.get(url, stream=True)
+def download_file(url, filename, etag_path=None):
+    """
+    Downloads a file from a URL with a progress bar.
+    If etag_path is given and both the file and its saved ETag exist, the request is
+    made conditional and nothing is downloaded when the server reports the file unchanged.
+    Returns True if the file was downloaded.
+    """
+    headers = {}
+    if etag_path and os.path.exists(filename) and os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as f:
+            headers["If-None-Match"] = f.read().strip()
+
+    response = requests.get(url, stream=True, headers=headers)
+    if response.status_code == 304:
+        response.close()
+        return False
     response.raise_for_status()
+
+    # Drop the old ETag first so an interrupted download is never treated as current
+    if etag_path and os.path.exists(etag_path):
+        os.remove(etag_path)
+
     total_size = int(response.headers.get("content-length", 0))
-    block_size = 1024  # 1 Kilobyte
-    
-    with open(filename, "wb") as f, tqdm(
+    block_size = 1 << 20  # 1 Megabyte
+
+    # Copy the raw stream in large blocks; the progress bar is updated once per write
+    response.raw.decode_content = True
+    with open(filename, "wb") as f, tqdm.wrapattr(
+        f,
+        "write",
         desc=filename,
         total=total_size,
-        unit="iB",
-        unit_scale=True,
-        unit_divisor=1024,
-    ) as bar:
-        for data in response.iter_content(block_size):
-            bar.update(len(data))
-            f.write(data)
+    ) as out:
+        shutil.copyfileobj(response.raw, out, length=block_size)
+
+    etag = response.headers.get("ETag")
+    if etag_path and etag:
+        with open(etag_path, "w", encoding="utf-8") as f:
+            f.write(etag)
+
+    return True
+
+def write_crates_csv(src, output_file):
+    """
+    Streams crates.csv from src into the standardized gzip-compressed output CSV,
+    one row at a time. Empty name/homepage/repository values are written as "nan".
+    Returns the number of crates written.
+    """
+    # Free-text columns such as readme and description can be longer than the
+    # default limit of 131072 characters per field; use the largest limit the
+    # platform's C long can hold
+    try:
+        csv.field_size_limit(sys.maxsize)
+    except OverflowError:
+        csv.field_size_limit(2**31 - 1)
+
+    reader = csv.reader(src)
+    header = next(reader)
+    name_col = header.index("name")
+    homepage_col = header.index("homepage")
+    repository_col = header.index("repository")
+
+    ids = itertools.count(1)
+    # Compress at the fastest level, which already shrinks the file several times over,
+    # and use a 1 MiB write buffer so the compressed file is written in large blocks
+    with open(output_file, "wb", buffering=1 << 20) as raw, \
+            gzip.open(raw, "wt", newline="", encoding="utf-8", compresslevel=1) as f:
+        writer = csv.writer(f)
+        writer.writerow(["ID", "Platform", "Name", "Homepage URL", "Repository URL"])
+        writer.writerows(
+            (next(ids), "Crates.io", row[name_col] or "nan", row[homepage_col] or "nan", row[repository_col] or "nan")
+            for row in reader
+        )
+
+    return next(ids) - 1
 
 def mine_crates():
     """Mines crates.io to get the whole list of Rust packages from the database dump."""
     
     dump_url = "https://static.crates.io/db-dump.tar.gz"
     dump_path = DUMP_PATH
-    extract_path = EXTRACT_PATH
+    etag_path = ETAG_PATH
 
-    # Download the database dump
-    if not os.path.exists(dump_path):
-        print("Downloading crates.io database dump...")
-        download_file(dump_url, dump_path)
+    # Download the database dump, unless the copy from a previous run is still current
+    print("Checking crates.io database dump...")
+    if download_file(dump_url, dump_path, etag_path):
+        print("Downloaded crates.io database dump.")
     else:
-        print("Database dump already downloaded.")
-
-    # Extract the database dump
-    print("Extracting database dump...")
-    with tarfile.open(dump_path, "r:gz") as tar:
-        tar.extractall(path=extract_path)
-
-    # Delete the tar.gz file
-    if os.path.exists(dump_path):
-        print("Deleting database dump archive...")
-        os.remove(dump_path)
-    
-    # Find the actual data directory (it has a date in the name)
-    data_dir = ""
-    for item in os.listdir(extract_path):
-        if os.path.isdir(os.path.join(extract_path, item)):
-            data_dir = os.path.join(extract_path, item)
-            break
-    
-    if not data_dir:
-        print("Could not find data directory in the extracted archive.")
-        return
-
-    crates_csv_path = os.path.join(data_dir, "data", "crates.csv")
-    if not os.path.exists(crates_csv_path):
-        print(f"crates.csv not found in {data_dir}")
-        return
-
-    print("Processing crate data...")
-    # Read the crates data
-    df = pd.read_csv(crates_csv_path)
+        print("Database dump already downloaded and unchanged.")
 
     # Create the path to the output file
     output_dir = OUTPUT_DIR
@@ -90,20 +122,23 @@ def mine_crates():
         os.makedirs(output_dir)
     output_file = os.path.join(output_dir, OUTPUT_FILENAME)
 
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["ID", "Platform", "Name", "Homepage URL", "Repository URL"])
-
-        for index, row in tqdm(df.iterrows(), total=df.shape[0], desc="Writing to CSV"):
-            writer.writerow([
-                index + 1,
-                "Crates.io",
-                row["name"],
-                row["homepage"],
-                row["repository"],
-            ])
+    # Scan the archive members in order and stream crates.csv directly from it into
+    # the output file, without extracting the rest of the dump to disk
+    print("Processing crate data...")
+    num_crates = None
+    with tarfile.open(dump_path, "r:gz") as tar:
+        for member in tar:
+            # The data directory has a date in the name, e.g. 2025-01-17-020046/data/crates.csv
+            if member.isfile() and member.name.endswith("/data/crates.csv"):
+                src = io.TextIOWrapper(tar.extractfile(member), encoding="utf-8", newline="")
+                num_crates = write_crates_csv(src, output_file)
+                break
+
+    if num_crates is None:
+        print("crates.csv not found in the database dump.")
+        return
 
-    print(f"Successfully saved {df.shape[0]} crates to {output_file}")
+    print(f"Successfully saved {num_crates} crates to {output_file}")
 
 if __name__ == "__main__":
     mine_crates()
@@ -0,0 +1,42 @@
+import csv
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from mine_crates import write_crates_csv
+
+
+class WriteCratesCsvTest(unittest.TestCase):
+    def write(self, rows):
+        """Runs write_crates_csv on a crates.csv built from rows and returns the output rows."""
+        src = io.StringIO(newline="")
+        writer = csv.writer(src)
+        writer.writerow(["id", "name", "description", "homepage", "readme", "repository"])
+        writer.writerows(rows)
+        src.seek(0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_file = os.path.join(tmp, "Crates.csv.gz")
+            count = write_crates_csv(src, output_file)
+            with gzip.open(output_file, "rt", newline="", encoding="utf-8") as f:
+                return count, list(csv.reader(f))
+
+    def test_field_longer_than_default_limit(self):
+        readme = "x" * 200_000
+        count, rows = self.write([["1", "serde", "", "", readme, "https://github.com/serde-rs/serde"]])
+
+        self.assertEqual(count, 1)
+        self.assertEqual(rows[1], ["1", "Crates.io", "serde", "nan", "https://github.com/serde-rs/serde"])
+
+    def test_empty_values_written_as_nan(self):
+        count, rows = self.write([["1", "", "", "", "", ""]])
+
+        self.assertEqual(count, 1)
+        self.assertEqual(rows[0], ["ID", "Platform", "Name", "Homepage URL", "Repository URL"])
+        self.assertEqual(rows[1], ["1", "Crates.io", "nan", "nan", "nan"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -355,19 +355,12 @@ def mine_go_packages(output_dir=None, output_filename=None):
     
     # Write results to CSV in order
     print("Writing results to CSV...")
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
+    with open(output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["ID", "Platform", "Name", "Homepage URL", "Repository URL"])
-        
-        for idx in sorted(results.keys()):
-            module_path, homepage_url, repo_url = results[idx]
-            writer.writerow([
-                idx,
-                "Go",
-                module_path,
-                homepage_url,
-                repo_url,
-            ])
+        writer.writerows(
+            (idx, "Go", *results[idx]) for idx in sorted(results.keys())
+        )
     
     print(f"Successfully saved {len(modules)} Go modules to {output_file}")
 
@@ -10,27 +10,45 @@ import org.apache.maven.index.reader.ChunkReader;
 import org.apache.maven.index.reader.Record;
 import org.apache.maven.index.reader.ResourceHandler;
 import org.apache.maven.index.reader.WritableResourceHandler;
-import org.apache.maven.model.Model;
-import org.apache.maven.model.Scm;
-import org.apache.maven.model.io.xpp3.MavenXpp3Reader;
+import org.codehaus.plexus.util.xml.pull.EntityReplacementMap;
+import org.codehaus.plexus.util.xml.pull.MXParser;
+import org.codehaus.plexus.util.xml.pull.XmlPullParser;
 import org.codehaus.plexus.util.xml.pull.XmlPullParserException;
 
 import java.io.*;
 import java.net.HttpURLConnection;
+import java.net.URI;
 import java.net.URL;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.time.Duration;
 import java.util.*;
 import java.util.concurrent.*;
 import java.util.concurrent.atomic.AtomicInteger;
+import java.util.zip.Deflater;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
 
 public class MavenCentralMiner {
     
     private static final String MAVEN_CENTRAL_URL = "https://repo1.maven.org/maven2/.index/";
     private static final String POM_BASE_URL = "https://repo1.maven.org/maven2/";
-    private static final int THREAD_POOL_SIZE = 50;
+    // POMs are fetched over one multiplexed HTTP/2 connection, so stay within the
+    // usual server limit of 100 concurrent streams per connection
+    private static final int MAX_CONCURRENT_REQUESTS = 100;
+    private static final int WORKER_THREADS = Runtime.getRuntime().availableProcessors();
     private static final int POM_TIMEOUT_MS = 10000;
+    private static final int POM_MAX_RETRIES = 3;
+    private static final long POM_RETRY_BACKOFF_MS = 300;
+    private static final int OUTPUT_BUFFER_SIZE = 1 << 20;
+    
+    // Placeholder written for missing URLs, shared with the Python miners' CSV format
+    private static final String NAN = "nan";
     
     public static void main(String[] args) {
         System.out.println("=".repeat(80));
@@ -52,23 +70,28 @@ public class MavenCentralMiner {
             // Create fresh temp directory
             Files.createDirectories(tempDir);
             
-            Path outputPath = Paths.get("../../../Resource/Dataset/Package-List/Maven.csv").toAbsolutePath().normalize();
+            Path outputPath = Paths.get("../../../Resource/Dataset/Package-List/Maven.csv.gz").toAbsolutePath().normalize();
             Files.createDirectories(outputPath.getParent());
             
             System.out.println("Temporary directory: " + tempDir);
             System.out.println("Output file: " + outputPath);
             System.out.println();
             
-            // Download and read Maven Central index
-            System.out.println("Step 1: Downloading Maven Central index...");
-            List<ArtifactInfo> artifacts = readMavenIndex(tempDir);
-            System.out.println("Found " + artifacts.size() + " artifacts in index");
-            System.out.println();
-            
-            // Fetch POM information for artifacts
-            System.out.println("Step 2: Fetching POM metadata...");
-            enrichWithPomData(artifacts);
-            System.out.println();
+            // Download and read Maven Central index, fetching the POM of each artifact
+            // as soon as it is found so that index reading and POM fetching overlap
+            List<ArtifactInfo> artifacts;
+            try (PomFetcher pomFetcher = new PomFetcher()) {
+                System.out.println("Step 1: Downloading Maven Central index and fetching POM metadata...");
+                artifacts = readMavenIndex(tempDir, pomFetcher);
+                System.out.println("Found " + artifacts.size() + " artifacts in index");
+                System.out.println();
+                
+                // Wait for the POM requests still in flight
+                System.out.println("Step 2: Waiting for remaining POM metadata...");
+                pomFetcher.awaitCompletion();
+                System.out.println("Completed processing all artifacts");
+                System.out.println();
+            }
             
             // Write to CSV
             System.out.println("Step 3: Writing results to CSV...");
@@ -96,7 +119,8 @@ public class MavenCentralMiner {
         }
     }
     
-    private static List<ArtifactInfo> readMavenIndex(Path tempDir) throws IOException {
+    private static List<ArtifactInfo> readMavenIndex(Path tempDir, PomFetcher pomFetcher)
+            throws IOException, InterruptedException {
         // Use a Set to track unique artifacts (groupId:artifactId) to avoid duplicates
         Set<String> seenArtifacts = new HashSet<>();
         List<ArtifactInfo> artifacts = new ArrayList<>();
@@ -182,11 +206,13 @@ public class MavenCentralMiner {
                                 artifactId != null && !artifactId.isEmpty() && 
                                 version != null && !version.isEmpty()) {
                                 
-                                // Only keep one version per artifact (groupId:artifactId)
+                                // Only keep one version per artifact (groupId:artifactId), so each
+                                // artifact costs a single POM fetch; Set.add both checks and records the key
                                 String artifactKey = groupId + ":" + artifactId;
-                                if (!seenArtifacts.contains(artifactKey)) {
-                                    seenArtifacts.add(artifactKey);
-                                    artifacts.add(new ArtifactInfo(groupId, artifactId, version));
+                                if (seenArtifacts.add(artifactKey)) {
+                                    ArtifactInfo artifact = new ArtifactInfo(groupId, artifactId, version);
+                                    artifacts.add(artifact);
+                                    pomFetcher.submit(artifact);
                                 }
                             }
                         }
@@ -210,77 +236,111 @@ public class MavenCentralMiner {
         return artifacts;
     }
     
-    private static void enrichWithPomData(List<ArtifactInfo> artifacts) {
-        ExecutorService executor = Executors.newFixedThreadPool(THREAD_POOL_SIZE);
-        AtomicInteger processed = new AtomicInteger(0);
-        int total = artifacts.size();
-        
-        System.out.println("Processing " + total + " artifacts with " + THREAD_POOL_SIZE + " threads...");
-        
-        List<Future<?>> futures = new ArrayList<>();
-        
-        for (ArtifactInfo artifact : artifacts) {
-            futures.add(executor.submit(() -> {
-                try {
-                    fetchPomInfo(artifact);
-                } catch (Exception e) {
-                    // Silently fail for individual artifacts
-                }
-                
-                int count = processed.incrementAndGet();
-                if (count % 1000 == 0) {
-                    System.out.printf("Progress: %d / %d (%.1f%%)%n", 
-                        count, total, (count * 100.0 / total));
-                }
-            }));
-        }
-        
-        // Wait for all tasks to complete
-        for (Future<?> future : futures) {
-            try {
-                future.get();
-            } catch (Exception e) {
-                // Continue processing
-            }
-        }
-        
-        executor.shutdown();
-        System.out.println("Completed processing all artifacts");
-    }
-    
-    private static void fetchPomInfo(ArtifactInfo artifact) {
+    private static CompletableFuture<Void> fetchPomInfo(HttpClient client, Executor executor,
+                                                        ArtifactInfo artifact, int attempt) {
         String groupPath = artifact.groupId.replace('.', '/');
         String pomUrl = String.format("%s%s/%s/%s/%s-%s.pom",
             POM_BASE_URL, groupPath, artifact.artifactId, artifact.version,
             artifact.artifactId, artifact.version);
         
+        HttpRequest request;
         try {
-            URL url = new URL(pomUrl);
-            HttpURLConnection conn = (HttpURLConnection) url.openConnection();
-            conn.setConnectTimeout(POM_TIMEOUT_MS);
-            conn.setReadTimeout(POM_TIMEOUT_MS);
+            request = HttpRequest.newBuilder(URI.create(pomUrl))
+                .timeout(Duration.ofMillis(POM_TIMEOUT_MS))
+                .header("Accept-Encoding", "gzip")
+                .GET()
+                .build();
+        } catch (IllegalArgumentException e) {
+            // Coordinates that do not form a valid URL - keep default "nan" values
+            return CompletableFuture.completedFuture(null);
+        }
+        
+        return client.sendAsync(request, HttpResponse.BodyHandlers.ofByteArray())
+            .thenApply(response -> {
+                if (response.statusCode() == 200) {
+                    parsePom(artifact, response);
+                    return false;
+                }
+                return isRetryableStatus(response.statusCode());
+            })
+            // Network error - retry, and keep default "nan" values if all attempts fail
+            .exceptionally(e -> true)
+            .thenCompose(retry -> {
+                if (!retry || attempt >= POM_MAX_RETRIES) {
+                    return CompletableFuture.completedFuture(null);
+                }
+                Executor backoff = CompletableFuture.delayedExecutor(
+                    POM_RETRY_BACKOFF_MS << attempt, TimeUnit.MILLISECONDS, executor);
+                return CompletableFuture.runAsync(() -> { }, backoff)
+                    .thenCompose(ignored -> fetchPomInfo(client, executor, artifact, attempt + 1));
+            });
+    }
+    
+    private static void parsePom(ArtifactInfo artifact, HttpResponse<byte[]> response) {
+        // Only <project><url> and <project><scm><url> are needed, so scan the POM with a
+        // pull parser instead of building the full Maven model for every artifact
+        try (InputStream in = openResponseBody(response)) {
+            // Resolve HTML entities such as &nbsp; or &eacute; (common in <description>)
+            // the same way MavenXpp3Reader does, instead of failing on the first one
+            XmlPullParser parser = new MXParser(EntityReplacementMap.defaultEntityReplacementMap);
+            parser.setInput(in, null);
             
-            if (conn.getResponseCode() == 200) {
-                try (InputStream in = conn.getInputStream()) {
-                    MavenXpp3Reader reader = new MavenXpp3Reader();
-                    Model model = reader.read(in);
-                    
-                    if (model.getUrl() != null && !model.getUrl().trim().isEmpty()) {
-                        artifact.homepageUrl = model.getUrl().trim();
-                    }
+            // Both fields usually appear near the top of the POM, so stop as soon as
+            // they have been seen instead of parsing dependencies, plugins and profiles
+            boolean inScm = false;
+            boolean foundHomepage = false;
+            boolean foundRepository = false;
+            for (int event = parser.next();
+                 event != XmlPullParser.END_DOCUMENT && !(foundHomepage && foundRepository);
+                 event = parser.next()) {
+                if (event == XmlPullParser.START_TAG) {
+                    int depth = parser.getDepth();
+                    String name = parser.getName();
                     
-                    if (model.getScm() != null && model.getScm().getUrl() != null) {
-                        artifact.repositoryUrl = model.getScm().getUrl().trim();
+                    if (depth == 2 && "scm".equals(name)) {
+                        inScm = true;
+                    } else if (depth == 2 && "url".equals(name)) {
+                        String url = parser.nextText().trim();
+                        if (!url.isEmpty()) {
+                            artifact.homepageUrl = url;
+                        }
+                        foundHomepage = true;
+                    } else if (depth == 3 && inScm && "url".equals(name)) {
+                        artifact.repositoryUrl = parser.nextText().trim();
+                        foundRepository = true;
                     }
+                } else if (event == XmlPullParser.END_TAG && parser.getDepth() == 2 && "scm".equals(parser.getName())) {
+                    inScm = false;
                 }
             }
-        } catch (Exception e) {
-            // Silently fail - keep default "nan" values
+        } catch (IOException | XmlPullParserException e) {
+            // Malformed POM - retrying will not help, keep default "nan" values
+        }
+    }
+    
+    private static InputStream openResponseBody(HttpResponse<byte[]> response) throws IOException {
+        InputStream in = new ByteArrayInputStream(response.body());
+        String encoding = response.headers().firstValue("Content-Encoding").orElse("");
+        if ("gzip".equalsIgnoreCase(encoding)) {
+            return new GZIPInputStream(in);
         }
+        return in;
+    }
+    
+    private static boolean isRetryableStatus(int status) {
+        return status == 429 || status == 500 || status == 502 || status == 503 || status == 504;
     }
     
     private static void writeToCSV(List<ArtifactInfo> artifacts, Path outputPath) throws IOException {
-        try (Writer writer = Files.newBufferedWriter(outputPath);
+        // The CSV is gzip-compressed at the fastest level, which already shrinks it
+        // several times over for little CPU cost
+        OutputStream out = new GZIPOutputStream(Files.newOutputStream(outputPath), OUTPUT_BUFFER_SIZE) {
+            {
+                def.setLevel(Deflater.BEST_SPEED);
+            }
+        };
+        try (Writer writer = new BufferedWriter(
+                 new OutputStreamWriter(out, StandardCharsets.UTF_8), OUTPUT_BUFFER_SIZE);
              CSVPrinter csv = new CSVPrinter(writer, CSVFormat.DEFAULT
                  .withHeader("ID", "Platform", "Name", "Homepage URL", "Repository URL"))) {
             
@@ -321,8 +381,8 @@ public class MavenCentralMiner {
         String groupId;
         String artifactId;
         String version;
-        String homepageUrl = "nan";
-        String repositoryUrl = "nan";
+        String homepageUrl = NAN;
+        String repositoryUrl = NAN;
         
         ArtifactInfo(String groupId, String artifactId, String version) {
             this.groupId = groupId;
@@ -331,6 +391,56 @@ public class MavenCentralMiner {
         }
     }
     
+    /**
+     * Fetches POM metadata in the background while the index is still being read.
+     * At most MAX_CONCURRENT_REQUESTS requests are in flight; submit() blocks when
+     * that limit is reached, which keeps the index reader from running far ahead.
+     */
+    static class PomFetcher implements AutoCloseable {
+        // One worker pool for the whole run handles response parsing and retry scheduling,
+        // instead of the client's default pool that retires idle threads and starts new ones
+        private final ExecutorService executor = Executors.newFixedThreadPool(WORKER_THREADS);
+        
+        // One asynchronous client for the whole run, and in-flight requests do not each
+        // occupy a thread. With HTTP/2 all requests share one TLS connection as separate
+        // streams with compressed headers, instead of a socket and handshake per request;
+        // the client falls back to HTTP/1.1 if the server does not negotiate HTTP/2
+        private final HttpClient client = HttpClient.newBuilder()
+            .version(HttpClient.Version.HTTP_2)
+            .connectTimeout(Duration.ofMillis(POM_TIMEOUT_MS))
+            .executor(executor)
+            .build();
+        
+        private final Semaphore inFlight = new Semaphore(MAX_CONCURRENT_REQUESTS);
+        private final AtomicInteger processed = new AtomicInteger(0);
+        
+        PomFetcher() {
+            System.out.println("Fetching POMs with up to " + MAX_CONCURRENT_REQUESTS
+                + " concurrent requests on " + WORKER_THREADS + " worker threads...");
+        }
+        
+        void submit(ArtifactInfo artifact) throws InterruptedException {
+            inFlight.acquire();
+            fetchPomInfo(client, executor, artifact, 0).whenComplete((ignored, error) -> {
+                int count = processed.incrementAndGet();
+                if (count % 1000 == 0) {
+                    System.out.println("Progress: " + count + " POMs processed");
+                }
+                inFlight.release();
+            });
+        }
+        
+        void awaitCompletion() throws InterruptedException {
+            inFlight.acquire(MAX_CONCURRENT_REQUESTS);
+            inFlight.release(MAX_CONCURRENT_REQUESTS);
+        }
+        
+        @Override
+        public void close() {
+            executor.shutdown();
+        }
+    }
+    
     static class FileResource implements ResourceHandler.Resource {
         private final File file;
         
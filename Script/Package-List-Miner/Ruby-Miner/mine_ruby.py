@@ -91,19 +91,12 @@ def mine_ruby_gems():
     
     # Write results to CSV in order
     print("Writing results to CSV...")
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
+    with open(output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["ID", "Platform", "Name", "Homepage URL", "Repository URL"])
-        
-        for idx in sorted(results.keys()):
-            gem_name, homepage_url, repo_url = results[idx]
-            writer.writerow([
-                idx,
-                "RubyGems",
-                gem_name,
-                homepage_url,
-                repo_url,
-            ])
+        writer.writerows(
+            (idx, "RubyGems", *results[idx]) for idx in sorted(results.keys())
+        )
     
     print(f"Successfully saved {len(gem_names)} Ruby gems to {output_file}")
 